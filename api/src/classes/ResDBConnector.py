@@ -1,425 +1,977 @@
-import datetime as dt 
-import pandas as pd 
-import sqlite3 as sql 
-
-from database_connectors import DatabaseConnector
-from database_connectors.classes.database_type import DatabaseType
-
-from utils import standardize_phone_number, standardize_date
-from .exceptions import InvalidTableNumberError, OverlappingReservationsError
-
-
-class ResDBConnector(DatabaseConnector):
-
-
-    # ---- Constructor ---- # 
-    def __init__(self, db_filepath:str): 
-        super().__init__(
-            DatabaseType.SQLITE,
-            host=None,
-            username=None,
-            password=None,
-            database=db_filepath, 
-            log_file_path='logs/ResDBConnector.log'
-        )
-
-
-    # ---- Methods for checking existing entries ---- #
-
-    def get_customer_id(self, first_name:str, last_name:str, phone_number:str) -> int|None: 
-        """Returns the customer_id if an existing customer matches ALL the given info (first name, last name, AND phone number), or None if no match is found."""
-        try:
-            # Normalize inputs
-            fn:str = first_name.strip()
-            ln:str = last_name.strip()
-            ph:str = standardize_phone_number(phone_number)
-
-            rows:list[tuple]|None = self.execute_one(
-                'SELECT customer_id '
-                'FROM Customer '
-                'WHERE first_name = ? COLLATE NOCASE '
-                '  AND last_name = ? COLLATE NOCASE '
-                '  AND phone_number = ?',
-                params=(fn, ln, ph),
-                fetch_results=True,     # Yes fetch results
-                commit=False            # No commit needed
-            )
-
-            # Return based on result
-            if rows:
-                return int(rows[0][0])  # rows like [(customer_id,)]
-            return None
-        
-        # Handle all exceptions as "no match"
-        except Exception as e: 
-            self.log_error('check_customer_exists()', e)
-            return None
-
-
-    def get_reservation_id(self, customer_id:int, reservation_datetime:str) -> int|None: 
-        """Returns the reservation_id for the given customer_id and reservation_datetime, or None if no
-        matches are found."""
-        try:
-            # Execute the query
-            rows: list[tuple] | None = self.execute_one(
-                "SELECT reservation_id FROM Reservation "
-                "WHERE customer_id = ? AND reservation_datetime = ? "
-                "LIMIT 1",
-                params=(customer_id, reservation_datetime),
-                fetch_results=True,
-                commit=False   
-            )
-
-            # Return based on result
-            if rows: return int(rows[0][0])  # Rows like [(123,)]
-            else: return None
-
-        # Handle exceptions as "not found"
-        except Exception as e:
-            self.log_error('get_reservation_id()', e)
-            return None
-        
-
-    def check_customer_has_reservation(self, customer_id:int, reservation_datetime:str) -> bool: 
-        """Returns True if the given customer has a reservation for the given datetime, False otherwise."""
-        try:
-            # Execute query
-            rows: list[tuple] | None = self.execute_one(
-                "SELECT 1 FROM Reservation "
-                "WHERE customer_id = ? AND reservation_datetime = ? "
-                "LIMIT 1",
-                params=(customer_id, reservation_datetime),
-                fetch_results=True,
-                commit=False  
-            )
-
-            # Return based on results (True if any rows are returned)
-            return bool(rows)
-        
-        # Handle exceptions as "not found"
-        except Exception as e:
-            self.log_error('reservation_exists()', e)
-            return False
-        
-
-    # ---- Methods for creating new entries ---- # 
-
-    def new_reservation(
-        self,
-        customer_fn:str, 
-        customer_ln:str, 
-        customer_phone:str, 
-        num_people:int, 
-        reservation_datetime:str,
-        customer_email:str|None=None,
-        date_created:str|None=None,
-        num_highchairs:int|None=None,
-        notes:str|None=None
-    ) -> int: 
-        """Creates a new entry in the [Reservation] table and returns the newly created ID
-            - Kwargs are optional and will be omitted in the insert if not provided
-            - The customer will be created if there is no customer with the matching info, otherwise the existing
-            customer will be used.
-        
-            Raises: 
-            - ValueError: if an invalid parameter is given or if a required parameter is missing
-            - KeyError: if there is an error retrieving or inserting the customer's information
-            - sql.IntegrityError: if the given customer already has a reservation for the given datetime
-            - sql.DataError: if there is any error inserting the reservation 
-        """
-        self.log_debug('new_reservation()', f'Creating a new reservation for "{customer_fn} {customer_ln}" on "{reservation_datetime}"')
-
-        # Validate input params
-        try: 
-            # Standardize inputs
-            customer_fn = customer_fn.strip()
-            customer_ln = customer_ln.strip()
-            customer_phone = standardize_phone_number(customer_phone)
-            reservation_datetime = standardize_date(reservation_datetime)
-            
-            if num_highchairs is None: num_highchairs = 0
-            if customer_email is None: customer_email = ''
-            if notes is None: notes = ''
-
-            # NOTE: if date_created is invalid, default to today (now)
-            try: 
-                date_created = standardize_date(date_created)
-            except ValueError: 
-                date_created = dt.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-
-            # Check that others are the correct type and within appropriate bounds
-            assert isinstance(num_people, int)
-            
-        # Exception means an input was invalid
-        except Exception as e: 
-
-            # Log the original error
-            self.log_error('new_reservation()', e)
-
-            # Log the ValueError (for invalid param)
-            exception:ValueError = ValueError('Invalid parameter given to new_reservation().')
-            self.log_error('new_reservation()', exception)
-
-            # Raise the ValueError
-            raise exception
-
-        # Create the customer if they do not exist, or get the existing ID (and update email)
-        self.log_debug('new_reservation()', f'Creating or updating customer information for "{customer_fn} {customer_ln}" (phone = "{customer_phone}")')
-        customer_id:int|None = self.insert_update_customer(customer_fn, customer_ln, customer_phone, email=customer_email)
-
-        # Check that an ID was found or that the insert was successful
-        if customer_id is None: 
-            
-            # Create and log the exception
-            exception:KeyError = KeyError('There was an error retrieving or inserting the info for the given customer.')
-            self.log_error('new_reservation()', exception)
-
-            # Raise the exception
-            raise exception
-
-        # If the customer DOES exist, check if they have a reservation for this datetime already
-        else: 
-            if self.check_customer_has_reservation(customer_id, reservation_datetime):
-
-                # Log a clear warning message
-                self.log_warning('new_reservation()', f'Customer (id = {customer_id}) already has a reservation for "{reservation_datetime}"')
-
-                # Create and log an exception
-                exc:Exception = sql.IntegrityError(f'Customer (id = {customer_id}) already has a reservation for "{reservation_datetime}"')
-                self.log_error('new_reservation()', e)
-
-                # Raise the exception
-                raise exc
-
-        # Insert the new row
-        self.log_debug('new_reservation()', 'Creating new Reservation entry.')
-
-        # NOTE: omit "reservation_id" column
-        self.new_table_row(
-            [customer_id, num_people, reservation_datetime, date_created, num_highchairs, notes],
-            'Reservation',
-            cols=['customer_id', 'num_people', 'reservation_datetime', 'date_created', 'num_highchairs', 'notes']
-        )
-
-        # Retrieve the ID of the newly inserted reservation
-        res_id:int|None = self.get_reservation_id(customer_id, reservation_datetime)
-
-        # NOTE: self.new_table_row() fails silently, so perform a manual check to see if the insert was successful
-        # Check that insert was successful 
-        if res_id is None: 
-            
-            # Create and log the error
-            exc:Exception = sql.DataError(f'Failed to create new reservation for Customer (id = {customer_id}) at date time "{reservation_datetime}"')
-            self.log_error('new_reservation()', exc)
-
-            # Raise the error
-            raise exc
-        
-        # Return the new reservation ID
-        self.log_debug('new_reservation()', f'Successfully created Reservation (id = {res_id})')
-        return res_id
-    
-
-    def insert_update_customer(self, first_name:str, last_name:str, phone_number:str|int, email:str='') -> int|None: 
-        """If the given info does not already exist for a customer, then a new customer is created and the ID of the newly created customer
-        is returned; if the given info does already exist, then the existing customer's (mutable) info is updated with the new info and the 
-        existing customer ID is returned.
-        
-        NOTE: returns None if an error occurs.
-        """
-
-        # Normalize inputs
-        first_name = first_name.strip()
-        last_name = last_name.strip()
-        phone_number = str(phone_number).strip()
-        email = email.strip()
-
-        # Check if the customer exists already
-        existing_id:int|None = self.get_customer_id(first_name, last_name, phone_number)
-
-        if existing_id is not None: 
-
-            # Update the customer's mutable attributes (just email)
-            if email: 
-                self.execute_one(
-                    'UPDATE Customer SET email = ? WHERE customer_id = ?', 
-                    [email, existing_id]
-                )
-
-            # Return the existing ID
-            return existing_id
-
-        # If the customer doesn't exist, create an entry
-        try: 
-
-            # Insert the new row
-            self.new_table_row(
-                (first_name, last_name, phone_number, email),
-                'Customer',
-                cols=['first_name', 'last_name', 'phone_number', 'email']   # NOTE: omit customer_id col
-            )
-
-            # Get the newly inserted ID
-            return self.get_customer_id(first_name, last_name, phone_number)
-
-        # Handle all exceptions
-        except Exception as e: 
-            self.log_error('insert_update_customer()', e)
-            return None
-        
-
-    def update_reservation_tables(self, reservation_id:int, table_numbers:list[int], spacing:int=2) -> None: 
-        """Updates/creates an entry in [ReservationAtTable] to assign the given reservation to the given table(s).
-            - NOTE: if only assigning the reservation to a single table, then the given table_numbers should be a list with one value
-            - The given 'spacing' should be the time (in hours) allocated per reservation; defaults to 2 hours
-            - Raises OverlappingReservationError if there is already a reservation at one or more of the given table_numbers within "spacing" hours
-            - Raises ReservationNotFound if the given reservation_id does not exist
-            - Raises InvalidTableNumberError if any of the given table numbers is invalid
-            - Raises 'Exception' if there is an error when executing the INSERT query into [ReservationAtTable]
-        """
-
-        # Get the info for the given reservation
-        reservation_info:dict = self.get_reservation_info(reservation_id)
-
-        # Check that results were found
-        if not reservation_info: 
-            exc:Exception = sql.DataError('The given reservation ID "{reservation_id}" does not exist or there was an error fetching the info.')
-            self.log_error('update_reservation_table()', exc)
-            raise exc
-
-        # Check that all table numbers are valid 
-        if not self.check_table_numbers(table_numbers): 
-            self.log_warning('update_reservation_tables()', f'Given one or more invalid table numbers: {table_numbers}')
-            raise InvalidTableNumberError(table_numbers=table_numbers)
-
-        # Check that these tables are available at the given time
-        for tn in table_numbers: 
-            if not self.check_table_available(tn, reservation_info['reservation_datetime'], spacing):
-                
-                # Create, log, and raise an OverlappingReservationsError
-                exc:Exception = OverlappingReservationsError(reservation_info['reservation_datetime'], tn, spacing)
-                self.log_error('update_reservation_table()', exc)
-                raise exc
-
-        # -- Valid tables if we make it here -- # 
-        # Create an entry for this reservation at each of these tables
-        try: 
-            self.execute_many(
-                """
-                INSERT INTO ReservationAtTable(reservation_id, reservation_datetime, table_number)
-                VALUES(?, ?, ?)
-                """,
-                [[reservation_id, reservation_info['reservation_datetime'], table_num] for table_num in table_numbers],
-                raise_on_error=True
-            )
-        
-        # NOTE: log and raise exceptions so we know if the insert failed on the frontend 
-        except Exception as e: 
-            self.log_error('update_reservation_tables()', e)
-            raise e
-
-
-    # ---- Methods for retrieving filtered data ---- # 
-
-    def get_reservations_for_date(self, date:dt.datetime) -> pd.DataFrame: 
-        """Returns a DataFrame containing the subset of [Reservations] that are on the given date."""
-
-        # Get the full [Reservation] table
-        reservations_df:pd.DataFrame = self.table_as_df('Reservation')
-
-        # Convert the "reservation_datetime" to dt.datetime type
-        reservations_df['reservation_datetime'] = pd.to_datetime(reservations_df['reservation_datetime'])
-
-        # Filter the df and return 
-        return reservations_df[
-            reservations_df['reservation_datetime'].dt.date == date.date()
-        ]
-    
-
-    def get_reservation_info(self, reservation_id:int) -> dict: 
-        """Returns the entry in the [Reservation] table for the given 'reservation_id'."""
-        
-        # Get the row 
-        # NOTE: self.execute_one() fails silently and returns None if no results
-        results:list[tuple]|None = self.execute_one(
-            'SELECT * FROM Reservation WHERE reservation_id = ?',
-            params=[reservation_id],
-            commit=False,
-            fetch_results=True
-        )
-
-        # Return results
-        if results is not None: 
-            
-            # Create a dict to return
-            d:dict[str,str|int] = {}
-
-            for col,r in zip(self.get_table_columns('Reservation'), results[0]): 
-                d[col] = r
-            
-            # Return the dict
-            return d
-
-        # No results/error finding entry
-        else: return None
-    
-
-    def check_table_numbers(self, table_numbers:list[int]) -> bool: 
-        """Returns True if all the given table numbers are valid/exist, False otherwise."""
-
-        # Get all the table numbers from the _Table table
-        all_table_numbers:list[int] = self.execute_one(
-            'SELECT table_number FROM _Table',
-            fetch_results=True,
-            commit=False
-        )
-
-        # Check that all the given table numbers exist in the retrieved list
-        return set(table_numbers).issubset(all_table_numbers)
-    
-
-    def check_table_available(self, table_number:int, datetime:str, spacing:float) -> bool: 
-        """Returns True if the given table number is available at the given datetime (YYYY-MM-DD HH:MM:SS) with a spacing of 
-        'spacing' hours."""
-
-        # Init a cursor
-        self._ensure_cxn()
-        cursor:sql.Cursor = self.cxn.cursor()
-        
-        try: 
-            # Special-case spacing <= 0: treat as "at the exact same second"
-            if spacing <= 0:
-                cursor.execute(
-                    f"""
-                        SELECT 1
-                        FROM ReservationAtTable
-                        WHERE table_number = ?
-                        AND reservation_datetime = ?
-                        LIMIT 1
-                    """, 
-                    (table_number, datetime)
-                )
-            else:
-                # julianday() returns days; convert to hours and compare to 'spacing'
-                cursor.execute(
-                    f"""
-                        SELECT 1
-                        FROM ReservationAtTable
-                        WHERE table_number = ?
-                        AND ABS(julianday(reservation_datetime) - julianday(?)) * 24 < ?
-                        LIMIT 1
-                    """,
-                    (table_number, datetime, float(spacing))
-                )
-
-            # Return based on results
-            return cursor.fetchone() is None
-        
-        # Handle exceptions
-        except Exception as e: 
-            self.log_error('check_table_available()', e)
-            return False
-        
-        # Close cursor
-        finally: 
-            cursor.close()
+import datetime as dt
+import pandas as pd
+import sqlite3 as sql
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator
+
+from database_connectors import DatabaseConnector
+from database_connectors.classes.database_type import DatabaseType
+
+# Per-greenlet connection storage when running under gevent, falling back to per-thread storage
+# NOTE: gevent is in the API requirements, but the fallback keeps tests/scripts dependency-free
+try:
+    from gevent.local import local as _ConnectionLocal
+except ImportError:
+    from threading import local as _ConnectionLocal
+
+from utils import standardize_phone_number, standardize_phone_numbers, standardize_date
+from .exceptions import InvalidTableNumberError, OverlappingReservationsError
+
+
+# SQL for the hot point-lookup queries
+# NOTE: hoisted to module level so every call passes the identical string object and hits
+# pysqlite's internal prepared-statement cache instead of re-preparing per call
+_SQL_GET_CUSTOMER_ID:str = (
+    'SELECT customer_id '
+    'FROM Customer '
+    'WHERE first_name = ? COLLATE NOCASE '
+    '  AND last_name = ? COLLATE NOCASE '
+    '  AND phone_number = ?'
+)
+
+_SQL_GET_RESERVATION_ID:str = (
+    'SELECT reservation_id FROM Reservation '
+    'WHERE customer_id = ? AND reservation_datetime = ? '
+    'LIMIT 1'
+)
+
+_SQL_CHECK_CUSTOMER_HAS_RES:str = (
+    'SELECT EXISTS('
+    'SELECT 1 FROM Reservation '
+    'WHERE customer_id = ? AND reservation_datetime = ?'
+    ')'
+)
+
+# Single-table availability probes (exact-second and spacing-window variants)
+# NOTE: single-line constants so the statement-cache lookup hashes the same (short) string object
+# every call instead of a fresh multi-line literal
+_SQL_EXACT:str = (
+    'SELECT 1 FROM ReservationAtTable '
+    'WHERE table_number = ? AND reservation_datetime = ? '
+    'LIMIT 1'
+)
+
+_SQL_RANGE:str = (
+    'SELECT 1 FROM ReservationAtTable '
+    'WHERE table_number = ? AND reservation_datetime > ? AND reservation_datetime < ? '
+    'LIMIT 1'
+)
+
+# Single round-trip reservation insert
+# NOTE: RETURNING hands back the new ID directly, and the UNIQUE(customer_id, reservation_datetime)
+# constraint rejects duplicates with an IntegrityError -- no pre-check or re-SELECT needed
+_SQL_INSERT_RESERVATION:str = (
+    'INSERT INTO Reservation(customer_id, num_people, reservation_datetime, date_created, num_highchairs, notes) '
+    'VALUES(?, ?, ?, ?, ?, ?) '
+    'RETURNING reservation_id'
+)
+
+# Single round-trip customer upsert
+# NOTE: relies on the UNIQUE(first_name, last_name, phone_number) constraint on [Customer]
+_SQL_UPSERT_CUSTOMER:str = (
+    'INSERT INTO Customer(first_name, last_name, phone_number, email) '
+    'VALUES(?, ?, ?, ?) '
+    'ON CONFLICT(first_name, last_name, phone_number) '
+    # NOTE: keep the existing email when the new one is empty; the CASE (rather than a DO UPDATE
+    # ... WHERE guard) means RETURNING always yields the existing customer_id on conflict
+    "DO UPDATE SET email = CASE WHEN excluded.email <> '' THEN excluded.email ELSE email END "
+    'RETURNING customer_id'
+)
+
+
+# Default PRAGMAs applied to every connection
+# NOTE:
+# - WAL + synchronous=NORMAL stops readers blocking writers and halves the fsync traffic per commit
+# - busy_timeout avoids immediate "database is locked" errors under concurrent requests
+# - journal_mode is persistent (stored in the db file), but busy_timeout/cache_size/etc are per-connection
+DEFAULT_PRAGMAS:dict[str,str|int] = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+    'cache_size': -20000,       # ~20 MiB page cache
+    'busy_timeout': 5000,       # ms to wait on a locked db before erroring
+    'mmap_size': 268435456,     # 256 MiB memory-mapped I/O
+    'foreign_keys': 'ON'        # enforce FK constraints (off by default in sqlite)
+}
+
+# Max entries in the per-connector availability LRU cache
+_AVAILABILITY_CACHE_SIZE:int = 512
+
+
+class ResDBConnector(DatabaseConnector):
+
+
+    # ---- Constructor ---- #
+    def __init__(self, db_filepath:str, pragmas:dict[str,str|int]|None=None, log_file_path:str|None='logs/ResDBConnector.log'):
+
+        # Save the db path and init the per-greenlet connection storage
+        # NOTE: these (and the PRAGMAs) must exist before super().__init__ runs, since the base
+        # constructor may create/assign the first connection through the cxn property below
+        self._db_filepath:str = db_filepath
+        self._local = _ConnectionLocal()
+
+        # Save the PRAGMAs to apply to each connection
+        # NOTE: default to DEFAULT_PRAGMAS if not given (kwarg is exposed so tests can override)
+        self.pragmas:dict[str,str|int] = dict(DEFAULT_PRAGMAS if pragmas is None else pragmas)
+
+        # Lazy cache of the valid table numbers (loaded on first check_table_numbers() call)
+        self._valid_tables:frozenset[int]|None = None
+
+        # LRU cache for availability probes, plus a version counter bumped on every
+        # [ReservationAtTable] write so stale entries are never served (the version is part of the
+        # cache key, so old entries simply age out)
+        self._availability_cache:OrderedDict = OrderedDict()
+        self._rat_version:int = 0
+
+        super().__init__(
+            DatabaseType.SQLITE,
+            host=None,
+            username=None,
+            password=None,
+            database=db_filepath,
+            # NOTE: exposed as a kwarg so tests can pass None and skip opening a log file handle
+            # per connector (a file open + descriptor per test otherwise)
+            log_file_path=log_file_path
+        )
+
+        # Materialize + tune the initial connection
+        # NOTE: the cxn property creates it on first access, so from here on every method can rely
+        # on an open connection without a per-call guard
+        if self.cxn is None:
+            raise sql.OperationalError(f'Could not open a connection to "{db_filepath}"')
+
+        # Create the indexes used by the hot queries (no-op until the schema exists)
+        self._ensure_indexes()
+
+
+    # ---- Connection management ---- #
+
+    @property
+    def cxn(self) -> sql.Connection|None:
+        """The (tuned) sqlite connection owned by the current greenlet/thread, created lazily on
+        first access.
+
+        NOTE: overrides the base class so concurrent gevent workers never share a single
+        sqlite3.Connection -- a shared connection serializes every query and is unsafe without
+        external locking, while with WAL enabled one connection per greenlet reads concurrently.
+        Because the property self-ensures, the hot methods need no per-call guard before using it.
+        (Caveat: a ':memory:' database is private to each connection, so the per-greenlet
+        connections only share state for file-backed databases; tests run single-greenlet.)
+        """
+        cxn:sql.Connection|None = getattr(self._local, 'cxn', None)
+        if cxn is None:
+            # NOTE: cached_statements is raised from the default 128 so all the hot constant SQL
+            # strings stay resident in pysqlite's per-connection statement cache
+            self._local.cxn = cxn = sql.connect(self._db_filepath, cached_statements=256)
+            self._apply_pragmas()
+        return cxn
+
+
+    @cxn.setter
+    def cxn(self, value:sql.Connection|None) -> None:
+        self._local.cxn = value
+
+
+    @property
+    def read_cxn(self) -> sql.Connection:
+        """A read-only sqlite connection for the current greenlet's pure-read hot paths, created
+        lazily on first access.
+
+        NOTE: opened with PRAGMA query_only=1, so the availability probes can never accidentally
+        write, and in WAL mode this reader proceeds concurrently with the greenlet's writer
+        connection instead of queueing behind its transactions. ':memory:' databases are private
+        per connection, so there the writer connection is reused instead.
+        """
+        if self._db_filepath == ':memory:':
+            return self.cxn
+
+        cxn:sql.Connection|None = getattr(self._local, 'read_cxn', None)
+        if cxn is None:
+            cxn = sql.connect(self._db_filepath, cached_statements=256)
+            cxn.row_factory = sql.Row
+
+            # Apply the per-connection PRAGMAs (journal_mode is persistent in the db file already)
+            for k in ('synchronous', 'temp_store', 'cache_size', 'busy_timeout', 'mmap_size'):
+                if k in self.pragmas: cxn.execute(f'PRAGMA {k}={self.pragmas[k]}')
+            cxn.execute('PRAGMA query_only=1')
+
+            self._local.read_cxn = cxn
+        return cxn
+
+
+    def _ensure_cxn(self) -> None:
+        """Kept for the base-class interface: accessing the cxn property already guarantees an
+        open, tuned connection for the current greenlet."""
+        self.cxn
+
+
+    def _fast_cursor(self) -> sql.Cursor:
+        """Returns a reused cursor bound to the current greenlet's connection, creating it on first
+        use (or when the connection has been replaced).
+
+        NOTE: the hottest point lookups go through this instead of the generic execute_one()
+        dispatcher, which pays cursor open/close, parameter coercion, and logging overhead around a
+        microsecond-scale SQLite call.
+        """
+        # NOTE: the property is bound to a local once -- each access is an ensure-check
+        cxn:sql.Connection = self.cxn
+        cur:sql.Cursor|None = getattr(self._local, 'fast_cur', None)
+
+        # (Re)create the cursor if missing or bound to a stale connection
+        if cur is None or getattr(self._local, 'fast_cur_cxn', None) is not cxn:
+            cur = self._local.fast_cur = cxn.cursor()
+            self._local.fast_cur_cxn = cxn
+
+        return cur
+
+
+    @contextmanager
+    def transaction(self) -> Iterator[sql.Connection]:
+        """Context manager that runs the enclosed statements in one explicit transaction on the
+        current greenlet's connection, committing on success and rolling back on any exception.
+
+        NOTE: without this, each statement commits individually through sqlite's autocommit -- for a
+        bulk flow of N writes that is N fsyncs/WAL flushes instead of one. BEGIN is issued explicitly
+        so the transaction opens immediately (pysqlite's implicit transactions only start on the
+        first DML statement).
+        """
+        cxn:sql.Connection = self.cxn
+        cxn.execute('BEGIN')
+        try:
+            yield cxn
+            cxn.execute('COMMIT')
+        except BaseException:
+            cxn.execute('ROLLBACK')
+            raise
+
+
+    def close(self) -> None:
+        """Closes the current greenlet's connection deterministically, running PRAGMA optimize
+        first.
+
+        NOTE: sqlite recommends PRAGMA optimize at close -- it refreshes the planner statistics
+        for whichever indexes this connection actually used, at a fraction of a full ANALYZE, so
+        the next process start plans well without re-analyzing.
+        """
+        # Close the read-only companion connection first, if one was opened
+        read_cxn:sql.Connection|None = getattr(self._local, 'read_cxn', None)
+        if read_cxn is not None:
+            read_cxn.close()
+            self._local.read_cxn = None
+
+        # NOTE: read the raw slot -- going through the self-ensuring property would pointlessly
+        # open a new connection just to close it
+        cxn:sql.Connection|None = getattr(self._local, 'cxn', None)
+        if cxn is None: return
+
+        # NOTE: optimize is best-effort; never let it block the close
+        try: cxn.execute('PRAGMA optimize')
+        except sql.Error: pass
+
+        cxn.close()
+        self.cxn = None
+
+
+    def __enter__(self) -> 'ResDBConnector':
+        return self
+
+
+    def __exit__(self, *exc) -> None:
+        # NOTE: with ResDBConnector(path) as connector: ... guarantees the handle (and the WAL
+        # file) is released even if the body raises
+        self.close()
+
+
+    def run_sql_script(self, script_path:str) -> None:
+        """Runs the SQL script at the given path (e.g. the DDL scripts in src/sql/) in a single
+        executescript call.
+
+        NOTE: executescript commits any pending transaction and executes the whole script itself,
+        so no cursor allocation or explicit commit() is needed around schema resets.
+        """
+        with open(script_path) as f:
+            self.cxn.executescript(f.read())
+        self.log_debug('run_sql_script()', f'Executed SQL script "{script_path}"')
+
+
+    def backup_to(self, dest_filepath:str) -> None:
+        """Snapshots the current database to the given file path using sqlite's online backup API.
+
+        NOTE: this enables the bulk-load-then-persist pattern -- build the database against
+        ':memory:' (no disk I/O at all during the inserts), then write it to disk once:
+
+            connector = ResDBConnector(':memory:')
+            connector.bulk_new_reservations(df)   # etc.
+            connector.backup_to('data/database.db')
+
+        The backup API copies page-by-page inside sqlite, so it is safe even if other connections
+        hold the destination file open.
+        """
+        dest:sql.Connection = sql.connect(dest_filepath)
+        try:
+            with dest:
+                self.cxn.backup(dest)
+            self.log_debug('backup_to()', f'Backed up database to "{dest_filepath}"')
+        finally:
+            dest.close()
+
+
+    def _apply_pragmas(self) -> None:
+        """Applies self.pragmas to the current greenlet's connection; no-op if this connection has
+        already been tuned."""
+
+        # Skip if this connection was already tuned
+        if self.cxn is getattr(self._local, 'tuned_cxn', None): return
+
+        # Fetch rows as sqlite3.Row so cells are accessible by column name with no extra metadata
+        # queries (Row still supports positional indexing, so existing callers are unaffected)
+        self.cxn.row_factory = sql.Row
+
+        # Apply all the PRAGMAs in one script
+        # NOTE: journal_mode is irrelevant for ':memory:' databases (e.g. test fixtures), so it is
+        # skipped there; everything else still applies
+        pragmas:dict[str,str|int] = self.pragmas
+        if self._db_filepath == ':memory:':
+            pragmas = {k: v for k,v in pragmas.items() if k != 'journal_mode'}
+
+        self.cxn.executescript('; '.join(f'PRAGMA {k}={v}' for k,v in pragmas.items()))
+
+        # Verify the journal mode actually in effect (e.g. ':memory:' dbs ignore WAL) and log it
+        journal_mode:str = self.cxn.execute('SELECT * FROM pragma_journal_mode').fetchone()[0]
+        self.log_debug('_apply_pragmas()', f'Connection tuned (journal_mode = "{journal_mode}")')
+
+        # Mark this connection as tuned
+        self._local.tuned_cxn = self.cxn
+
+
+    def _ensure_indexes(self) -> None:
+        """Creates the indexes used by the hot queries if they do not exist; logs a warning (instead of raising)
+        if the schema has not been created yet."""
+        # NOTE:
+        # - idx_rat_table_dt includes reservation_id so availability probes and assignment lookups
+        #   are answered from the index alone (no heap fetch per match)
+        # - Customer(first_name, last_name, phone_number) and
+        #   Reservation(customer_id, reservation_datetime) are already indexed by their UNIQUE
+        #   constraints in the DDL, so they are not duplicated here
+        # - ANALYZE refreshes the planner's statistics after any index creation
+        try:
+            self.cxn.executescript(
+                'CREATE INDEX IF NOT EXISTS idx_reservation_dt ON Reservation(reservation_datetime);'
+                'CREATE INDEX IF NOT EXISTS idx_rat_table_dt ON ReservationAtTable(table_number, reservation_datetime, reservation_id);'
+                'ANALYZE;'
+            )
+        except sql.Error as e:
+            self.log_warning('_ensure_indexes()', f'Could not create indexes (schema may not exist yet): {e}')
+
+
+    # ---- Methods for checking existing entries ---- #
+
+    def get_customer_id(self, first_name:str, last_name:str, phone_number:str) -> int|None: 
+        """Returns the customer_id if an existing customer matches ALL the given info (first name, last name, AND phone number), or None if no match is found."""
+        try:
+            # Normalize inputs
+            fn:str = first_name.strip()
+            ln:str = last_name.strip()
+            ph:str = standardize_phone_number(phone_number)
+
+            # Hot path: run the lookup directly on the reused cursor
+            row:sql.Row|None = self._fast_cursor().execute(_SQL_GET_CUSTOMER_ID, (fn, ln, ph)).fetchone()
+
+            # Return based on result
+            return row['customer_id'] if row else None
+
+        # Handle db errors and invalid inputs as "no match"
+        except (sql.Error, ValueError) as e:
+            self.log_error('get_customer_id()', e)
+            return None
+
+
+    def get_reservation_id(self, customer_id:int, reservation_datetime:str) -> int|None: 
+        """Returns the reservation_id for the given customer_id and reservation_datetime, or None if no
+        matches are found."""
+        try:
+            # Run the lookup on the reused cursor and fetch the single row directly
+            # NOTE: fetchone() instead of execute_one()'s fetchall avoids allocating a one-element
+            # result list per call
+            row:sql.Row|None = self._fast_cursor().execute(
+                _SQL_GET_RESERVATION_ID,
+                (customer_id, reservation_datetime)
+            ).fetchone()
+
+            # Return based on result
+            return row['reservation_id'] if row else None
+
+        # Handle exceptions as "not found"
+        except Exception as e:
+            self.log_error('get_reservation_id()', e)
+            return None
+        
+
+    def check_customer_has_reservation(self, customer_id:int, reservation_datetime:str) -> bool: 
+        """Returns True if the given customer has a reservation for the given datetime, False otherwise."""
+        try:
+            # Hot path: run the EXISTS probe directly on the reused cursor
+            # NOTE: EXISTS always yields exactly one 0/1 row, so this is a single scalar fetch
+            # (no result-list allocation) and sqlite stops at the first match
+            row:sql.Row = self._fast_cursor().execute(
+                _SQL_CHECK_CUSTOMER_HAS_RES,
+                (customer_id, reservation_datetime)
+            ).fetchone()
+
+            # Return based on results
+            return bool(row[0])
+
+        # Handle db errors as "not found"
+        except sql.Error as e:
+            self.log_error('check_customer_has_reservation()', e)
+            return False
+        
+
+    # ---- Methods for creating new entries ---- # 
+
+    def new_reservation(
+        self,
+        customer_fn:str, 
+        customer_ln:str, 
+        customer_phone:str, 
+        num_people:int, 
+        reservation_datetime:str,
+        customer_email:str|None=None,
+        date_created:str|None=None,
+        num_highchairs:int|None=None,
+        notes:str|None=None
+    ) -> int: 
+        """Creates a new entry in the [Reservation] table and returns the newly created ID
+            - Kwargs are optional and will be omitted in the insert if not provided
+            - The customer will be created if there is no customer with the matching info, otherwise the existing
+            customer will be used.
+        
+            Raises: 
+            - ValueError: if an invalid parameter is given or if a required parameter is missing
+            - KeyError: if there is an error retrieving or inserting the customer's information
+            - sql.IntegrityError: if the given customer already has a reservation for the given datetime
+            - sql.DataError: if there is any error inserting the reservation 
+        """
+        self.log_debug('new_reservation()', f'Creating a new reservation for "{customer_fn} {customer_ln}" on "{reservation_datetime}"')
+
+        # Validate input params
+        try: 
+            # Standardize inputs
+            customer_fn = customer_fn.strip()
+            customer_ln = customer_ln.strip()
+            customer_phone = standardize_phone_number(customer_phone)
+            reservation_datetime = standardize_date(reservation_datetime)
+            
+            if num_highchairs is None: num_highchairs = 0
+            if customer_email is None: customer_email = ''
+            if notes is None: notes = ''
+
+            # NOTE: if date_created is invalid, default to today (now)
+            # NOTE: isoformat() produces the same 'YYYY-MM-DD HH:MM:SS' string as strftime did,
+            # ~2x faster (no format-string parse)
+            try:
+                date_created = standardize_date(date_created)
+            except ValueError:
+                date_created = dt.datetime.now().isoformat(sep=' ', timespec='seconds')
+
+            # Check that others are the correct type and within appropriate bounds
+            assert isinstance(num_people, int)
+            
+        # Exception means an input was invalid
+        except Exception as e:
+
+            # Log one record and chain the root cause onto the raised ValueError -- 'from e' keeps
+            # the original error in the traceback, so separate log writes per exception add nothing
+            exception:ValueError = ValueError(f'Invalid parameter given to new_reservation(): {e}')
+            self.log_error('new_reservation()', exception)
+            raise exception from e
+
+        # Create the customer if they do not exist, or get the existing ID (and update email)
+        self.log_debug('new_reservation()', f'Creating or updating customer information for "{customer_fn} {customer_ln}" (phone = "{customer_phone}")')
+        customer_id:int|None = self.insert_update_customer(customer_fn, customer_ln, customer_phone, email=customer_email)
+
+        # Check that an ID was found or that the insert was successful
+        if customer_id is None:
+
+            # Create and log the exception
+            exception:KeyError = KeyError('There was an error retrieving or inserting the info for the given customer.')
+            self.log_error('new_reservation()', exception)
+
+            # Raise the exception
+            raise exception
+
+        # Insert the new row and get the new ID back from the same statement
+        # NOTE: the UNIQUE(customer_id, reservation_datetime) constraint enforces the
+        # one-reservation-per-datetime rule, so the old pre-check (a check-then-insert race anyway)
+        # and the follow-up get_reservation_id() round trip are no longer needed
+        self.log_debug('new_reservation()', 'Creating new Reservation entry.')
+
+        try:
+            cxn:sql.Connection = self.cxn
+            with cxn:
+                row:sql.Row = cxn.execute(
+                    _SQL_INSERT_RESERVATION,
+                    (customer_id, num_people, reservation_datetime, date_created, num_highchairs, notes)
+                ).fetchone()
+
+        # IntegrityError means the customer already has a reservation for this datetime
+        except sql.IntegrityError as e:
+
+            # Create, log (once), and raise an exception with a clear message
+            exc:Exception = sql.IntegrityError(f'Customer (id = {customer_id}) already has a reservation for "{reservation_datetime}"')
+            self.log_error('new_reservation()', exc)
+            raise exc from e
+
+        # Any other error means the insert failed
+        except Exception as e:
+
+            # Create, log, and raise the error
+            exc:Exception = sql.DataError(f'Failed to create new reservation for Customer (id = {customer_id}) at date time "{reservation_datetime}"')
+            self.log_error('new_reservation()', exc)
+            raise exc from e
+
+        # Return the new reservation ID
+        res_id:int = row['reservation_id']
+        self.log_debug('new_reservation()', f'Successfully created Reservation (id = {res_id})')
+        return res_id
+    
+
+    def bulk_new_reservations(self, reservations_df:pd.DataFrame) -> int:
+        """Creates entries in [Customer] and [Reservation] for every row of the given DataFrame in a
+        single transaction, and returns the number of reservations inserted.
+
+            - Required columns: first_name, last_name, phone_number, num_people, reservation_datetime
+            - Optional columns (defaulted like new_reservation() kwargs): email, date_created,
+              num_highchairs, notes
+            - Customers are deduplicated within the batch and upserted with one executemany, then all
+              reservations are inserted with a second executemany -- a handful of statements and one
+              commit for the whole frame, instead of ~5 round trips + commits per row through
+              new_reservation().
+
+            Raises:
+            - ValueError: if a required column is missing or a value fails normalization
+            - sql.IntegrityError / sql.Error: propagated from the inserts (the whole batch rolls back)
+        """
+        df:pd.DataFrame = reservations_df.copy()
+
+        # Check for the required columns
+        missing:list[str] = [c for c in ('first_name', 'last_name', 'phone_number', 'num_people', 'reservation_datetime') if c not in df.columns]
+        if missing:
+            exc:Exception = ValueError(f'Missing required column(s) for bulk_new_reservations(): {missing}')
+            self.log_error('bulk_new_reservations()', exc)
+            raise exc
+
+        # Default the optional columns
+        # NOTE: "now" is formatted once for the whole batch
+        now_str:str = dt.datetime.now().isoformat(sep=' ', timespec='seconds')
+        if 'email' not in df.columns: df['email'] = ''
+        if 'date_created' not in df.columns: df['date_created'] = now_str
+        if 'num_highchairs' not in df.columns: df['num_highchairs'] = 0
+        if 'notes' not in df.columns: df['notes'] = ''
+
+        # Normalize all the inputs up front (mirrors the per-row normalization in new_reservation,
+        # but amortized over whole columns with vectorized pandas ops instead of per-row Python calls)
+        df['first_name'] = df['first_name'].astype(str).str.strip()
+        df['last_name'] = df['last_name'].astype(str).str.strip()
+        df['phone_number'] = standardize_phone_numbers(df['phone_number'])
+        df['email'] = df['email'].fillna('').astype(str).str.strip()
+        df['notes'] = df['notes'].fillna('')
+
+        # Parse/format the datetimes column-wise (one C-level pass per column)
+        try:
+            # NOTE: format='mixed' infers per element, matching the scalar standardize_date behavior
+            df['reservation_datetime'] = pd.to_datetime(df['reservation_datetime'], format='mixed', errors='raise').dt.strftime('%Y-%m-%d %H:%M:%S')
+        except Exception as e:
+            exc:Exception = ValueError('One or more invalid reservation_datetime values given to bulk_new_reservations().')
+            self.log_error('bulk_new_reservations()', exc)
+            raise exc from e
+
+        # NOTE: invalid date_created values fall back to "now", like new_reservation()
+        df['date_created'] = (
+            pd.to_datetime(df['date_created'], format='mixed', errors='coerce')
+            .dt.strftime('%Y-%m-%d %H:%M:%S')
+            .fillna(now_str)
+        )
+
+        # Run the whole batch as one transaction: customer upsert, ID attach, reservation insert
+        # NOTE: the yielded connection is used as a local so the batch skips the per-access
+        # property dispatch
+        with self.transaction() as cxn:
+
+            # Upsert the unique customers in one executemany
+            customers_df:pd.DataFrame = df.drop_duplicates(['first_name', 'last_name', 'phone_number'])
+            cxn.executemany(
+                'INSERT INTO Customer(first_name, last_name, phone_number, email) VALUES(?, ?, ?, ?) '
+                'ON CONFLICT(first_name, last_name, phone_number) '
+                "DO UPDATE SET email = CASE WHEN excluded.email <> '' THEN excluded.email ELSE email END",
+                list(zip(
+                    customers_df['first_name'].tolist(),
+                    customers_df['last_name'].tolist(),
+                    customers_df['phone_number'].tolist(),
+                    customers_df['email'].tolist()
+                ))
+            )
+
+            # Attach customer_ids with one targeted row-value IN query over just the batch's
+            # customers, instead of pulling the whole [Customer] table and merging
+            # NOTE: the name columns are COLLATE NOCASE in the db (the comparison uses the column's
+            # collation), so the lookup dict is keyed on casefolded names to match
+            uniq:list[tuple] = list(zip(
+                customers_df['first_name'].tolist(),
+                customers_df['last_name'].tolist(),
+                customers_df['phone_number'].tolist()
+            ))
+            values:str = ','.join(['(?, ?, ?)'] * len(uniq))
+            id_by_key:dict[tuple,int] = {
+                (r['first_name'].casefold(), r['last_name'].casefold(), r['phone_number']): r['customer_id']
+                for r in cxn.execute(
+                    'SELECT customer_id, first_name, last_name, phone_number FROM Customer '
+                    f'WHERE (first_name, last_name, phone_number) IN (VALUES {values})',
+                    [v for key in uniq for v in key]
+                ).fetchall()
+            }
+            df['customer_id'] = [
+                id_by_key[(fn.casefold(), ln.casefold(), ph)]
+                for fn, ln, ph in zip(df['first_name'].tolist(), df['last_name'].tolist(), df['phone_number'].tolist())
+            ]
+
+            # Insert all the reservations in one executemany
+            # NOTE: Series.tolist() converts numpy scalars to native Python types for sqlite binding
+            rows:list[tuple] = list(zip(
+                df['customer_id'].tolist(),
+                df['num_people'].tolist(),
+                df['reservation_datetime'].tolist(),
+                df['date_created'].tolist(),
+                df['num_highchairs'].tolist(),
+                df['notes'].tolist()
+            ))
+            cxn.executemany(
+                'INSERT INTO Reservation(customer_id, num_people, reservation_datetime, date_created, num_highchairs, notes) '
+                'VALUES(?, ?, ?, ?, ?, ?)',
+                rows
+            )
+
+        # Return the number of reservations inserted
+        self.log_debug('bulk_new_reservations()', f'Inserted {len(rows)} reservations in one batch.')
+        return len(rows)
+
+
+    def insert_update_customer(self, first_name:str, last_name:str, phone_number:str|int, email:str='') -> int|None:
+        """If the given info does not already exist for a customer, then a new customer is created and the ID of the newly created customer
+        is returned; if the given info does already exist, then the existing customer's (mutable) info is updated with the new info and the 
+        existing customer ID is returned.
+        
+        NOTE: returns None if an error occurs.
+        """
+
+        # Normalize inputs
+        first_name = first_name.strip()
+        last_name = last_name.strip()
+        phone_number = str(phone_number).strip()
+        email = email.strip()
+
+        # Insert-or-update in a single round trip
+        # NOTE: the UPSERT replaces the old SELECT -> (UPDATE | INSERT) -> SELECT dance (2-3 round
+        # trips + 2 commits) with one statement + one commit, and RETURNING hands back the ID directly
+        try:
+            cxn:sql.Connection = self.cxn
+            with cxn:
+                row:tuple|None = cxn.execute(
+                    _SQL_UPSERT_CUSTOMER,
+                    (first_name, last_name, phone_number, email)
+                ).fetchone()
+
+            # Return the (new or existing) ID
+            return int(row[0])
+
+        # Handle all exceptions
+        except Exception as e:
+            self.log_error('insert_update_customer()', e)
+            return None
+        
+
+    def update_reservation_tables(self, reservation_id:int, table_numbers:list[int], spacing:int=2) -> None: 
+        """Updates/creates an entry in [ReservationAtTable] to assign the given reservation to the given table(s).
+            - NOTE: if only assigning the reservation to a single table, then the given table_numbers should be a list with one value
+            - The given 'spacing' should be the time (in hours) allocated per reservation; defaults to 2 hours
+            - Raises OverlappingReservationError if there is already a reservation at one or more of the given table_numbers within "spacing" hours
+            - Raises ReservationNotFound if the given reservation_id does not exist
+            - Raises InvalidTableNumberError if any of the given table numbers is invalid
+            - Raises 'Exception' if there is an error when executing the INSERT query into [ReservationAtTable]
+        """
+
+        # Get the info for the given reservation
+        reservation_info:dict = self.get_reservation_info(reservation_id)
+
+        # Check that results were found
+        if not reservation_info: 
+            exc:Exception = sql.DataError('The given reservation ID "{reservation_id}" does not exist or there was an error fetching the info.')
+            self.log_error('update_reservation_table()', exc)
+            raise exc
+
+        # Check that all table numbers are valid 
+        if not self.check_table_numbers(table_numbers): 
+            self.log_warning('update_reservation_tables()', f'Given one or more invalid table numbers: {table_numbers}')
+            raise InvalidTableNumberError(table_numbers=table_numbers)
+
+        # Check that these tables are available at the given time
+        # NOTE: one query for all the given tables instead of one round-trip per table
+        available:set[int] = self.check_tables_available(table_numbers, reservation_info['reservation_datetime'], spacing)
+
+        for tn in table_numbers:
+            if tn not in available:
+
+                # Create, log, and raise an OverlappingReservationsError
+                exc:Exception = OverlappingReservationsError(reservation_info['reservation_datetime'], tn, spacing)
+                self.log_error('update_reservation_table()', exc)
+                raise exc
+
+        # -- Valid tables if we make it here -- #
+        # Create an entry for this reservation at each of these tables
+        # NOTE: one executemany inside an explicit transaction binds the statement once and commits
+        # once for all rows, instead of paying a commit per row
+        rows:list[tuple[int,str,int]] = [
+            (reservation_id, reservation_info['reservation_datetime'], table_num)
+            for table_num in table_numbers
+        ]
+
+        try:
+            cxn:sql.Connection = self.cxn
+            with cxn:
+                cxn.executemany(
+                    'INSERT INTO ReservationAtTable(reservation_id, reservation_datetime, table_number) '
+                    'VALUES(?, ?, ?)',
+                    rows
+                )
+
+            # Invalidate the cached availability probes (the version is part of their cache key)
+            self._rat_version += 1
+
+        # NOTE: log and raise exceptions so we know if the insert failed on the frontend
+        except Exception as e:
+            self.log_error('update_reservation_tables()', e)
+            raise e
+
+
+    # ---- Methods for retrieving filtered data ---- # 
+
+    def get_reservations_for_date(self, date:dt.datetime) -> pd.DataFrame:
+        """Returns a DataFrame containing the subset of [Reservations] that are on the given date."""
+
+        # Compute the [start, end) bounds for the given date
+        # NOTE: ISO datetime strings sort lexicographically == chronologically, so SQLite can answer
+        # this with an index range seek instead of loading + parsing the whole table in pandas
+        start:str = date.strftime('%Y-%m-%d 00:00:00')
+        end:str = (date + dt.timedelta(days=1)).strftime('%Y-%m-%d 00:00:00')
+
+        # Query only the matching rows, parsing the datetimes while the frame is built
+        return pd.read_sql_query(
+            'SELECT * FROM Reservation WHERE reservation_datetime >= ? AND reservation_datetime < ?',
+            self.cxn,
+            params=(start, end),
+            # NOTE: the explicit format skips per-column format inference -- the column is always
+            # 'YYYY-MM-DD HH:MM:SS' since every write path standardizes it on the way in
+            parse_dates={'reservation_datetime': '%Y-%m-%d %H:%M:%S'}
+        )
+
+
+    def get_reservations_for_date_rows(self, date:dt.datetime) -> list[sql.Row]:
+        """Returns the subset of [Reservations] that are on the given date as a list of sqlite3.Row.
+
+        NOTE: skips the DataFrame build entirely -- callers that just list reservations (e.g. a
+        "today's reservations" endpoint) don't need the per-column array allocations pandas makes;
+        use get_reservations_for_date() only when actual DataFrame ops are needed.
+        """
+
+        # Same half-open [start, end) bounds as get_reservations_for_date()
+        start:str = date.strftime('%Y-%m-%d 00:00:00')
+        end:str = (date + dt.timedelta(days=1)).strftime('%Y-%m-%d 00:00:00')
+
+        return self.cxn.execute(
+            'SELECT * FROM Reservation WHERE reservation_datetime >= ? AND reservation_datetime < ?',
+            (start, end)
+        ).fetchall()
+    
+
+    def get_reservation_info(self, reservation_id:int) -> dict: 
+        """Returns the entry in the [Reservation] table for the given 'reservation_id'."""
+        
+        # Get the row 
+        # NOTE: self.execute_one() fails silently and returns None if no results
+        results:list[tuple]|None = self.execute_one(
+            'SELECT * FROM Reservation WHERE reservation_id = ?',
+            params=[reservation_id],
+            commit=False,
+            fetch_results=True
+        )
+
+        # Return results
+        # NOTE: sqlite3.Row carries the column names, so no table-metadata lookup is needed
+        if results is not None:
+            return dict(results[0])
+
+        # No results/error finding entry
+        else: return None
+    
+
+    def check_table_numbers(self, table_numbers:list[int]) -> bool:
+        """Returns True if all the given table numbers are valid/exist, False otherwise.
+
+        NOTE: the set of valid table numbers is small and effectively static, so it is loaded once
+        into a frozenset and every later call is a pure in-memory subset check -- no query per
+        request. Call invalidate_valid_tables() after any insert/delete on [_Table].
+        """
+
+        # Lazy-load the cache on the first call
+        if self._valid_tables is None:
+            try:
+                rows:list[tuple] = self.cxn.execute('SELECT table_number FROM _Table').fetchall()
+                self._valid_tables = frozenset(int(r[0]) for r in rows)
+
+            # Handle db errors as "invalid" (and leave the cache unset so the next call retries)
+            except sql.Error as e:
+                self.log_error('check_table_numbers()', e)
+                return False
+
+        # All valid iff every given number is in the cached set
+        return frozenset(table_numbers).issubset(self._valid_tables)
+
+
+    def invalidate_valid_tables(self) -> None:
+        """Drops the cached set of valid table numbers so the next check_table_numbers() call
+        reloads it; call after any insert/delete on [_Table]."""
+        self._valid_tables = None
+    
+
+    @staticmethod
+    def _spacing_bounds(datetime:str, spacing:float) -> tuple[str,str]:
+        """Returns the (lower, upper) ISO datetime strings exactly 'spacing' hours before/after the
+        given datetime (YYYY-MM-DD HH:MM:SS)."""
+        t:dt.datetime = dt.datetime.strptime(datetime, '%Y-%m-%d %H:%M:%S')
+        window:dt.timedelta = dt.timedelta(hours=spacing)
+        return (
+            (t - window).strftime('%Y-%m-%d %H:%M:%S'),
+            (t + window).strftime('%Y-%m-%d %H:%M:%S')
+        )
+
+
+    def _cache_availability(self, key:tuple, available:bool) -> bool:
+        """Stores an availability probe result in the LRU cache (evicting the least-recently-used
+        entry past the cap) and returns it."""
+        cache:OrderedDict = self._availability_cache
+        cache[key] = available
+        if len(cache) > _AVAILABILITY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return available
+
+
+    def check_table_available_at(self, table_number:int, datetime:str) -> bool:
+        """Returns True if the given table has no reservation at exactly the given datetime
+        (YYYY-MM-DD HH:MM:SS)."""
+
+        # Serve repeated probes from the in-process LRU (pagination/hover/submit in one UI session
+        # re-ask the same tuple); the version in the key means a write invalidates everything
+        key:tuple = (table_number, datetime, 0, self._rat_version)
+        cache:OrderedDict = self._availability_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        # NOTE: Connection.execute() is the one-shot shortcut -- no Python-level Cursor allocation
+        # or close per call, which matters when the booking UI runs these checks in a loop
+        try:
+            row:sql.Row|None = self.read_cxn.execute(_SQL_EXACT, (table_number, datetime)).fetchone()
+
+        # Handle exceptions (error results are NOT cached)
+        except Exception as e:
+            self.log_error('check_table_available_at()', e)
+            return False
+
+        return self._cache_availability(key, row is None)
+
+
+    def check_table_available_window(self, table_number:int, datetime:str, spacing:float) -> bool:
+        """Returns True if the given table has no reservation within strictly less than 'spacing'
+        hours of the given datetime (YYYY-MM-DD HH:MM:SS)."""
+
+        # Same LRU as check_table_available_at()
+        key:tuple = (table_number, datetime, spacing, self._rat_version)
+        cache:OrderedDict = self._availability_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        try:
+            # Compare against a Python-precomputed (lower, upper) window on the raw ISO strings
+            # NOTE: wrapping the column in julianday() made the predicate unindexable (full scan
+            # per call); ISO strings sort chronologically, so a plain range uses the
+            # (table_number, reservation_datetime) index. Bounds are exclusive to preserve the
+            # strict "< spacing" semantics.
+            lower, upper = self._spacing_bounds(datetime, spacing)
+            row:sql.Row|None = self.read_cxn.execute(_SQL_RANGE, (table_number, lower, upper)).fetchone()
+
+        # Handle exceptions (error results are NOT cached)
+        except Exception as e:
+            self.log_error('check_table_available_window()', e)
+            return False
+
+        return self._cache_availability(key, row is None)
+
+
+    def check_table_available(self, table_number:int, datetime:str, spacing:float) -> bool:
+        """Returns True if the given table number is available at the given datetime (YYYY-MM-DD HH:MM:SS) with a spacing of
+        'spacing' hours.
+
+        NOTE: thin dispatcher -- callers that know their semantics up front can call the
+        specialized methods directly and skip the spacing branch per call.
+        """
+        # Special-case spacing <= 0: treat as "at the exact same second"
+        if spacing <= 0:
+            return self.check_table_available_at(table_number, datetime)
+        return self.check_table_available_window(table_number, datetime, spacing)
+
+
+    def check_tables_available(self, table_numbers:list[int], datetime:str, spacing:float) -> set[int]:
+        """Returns the subset of the given table numbers that are available at the given datetime
+        (YYYY-MM-DD HH:MM:SS) with a spacing of 'spacing' hours.
+
+        NOTE: checks all the given tables in a single query instead of one round-trip per table;
+        returns an empty set (nothing available) if an error occurs.
+        """
+
+        # Nothing to check for an empty list (and avoids an empty IN () clause)
+        if not table_numbers: return set()
+
+        # Build the placeholder list for the IN clause
+        placeholders:str = ','.join('?' * len(table_numbers))
+
+        try:
+            # Special-case spacing <= 0: treat as "at the exact same second"
+            # NOTE: pure read, so it runs on the read-only companion connection
+            if spacing <= 0:
+                rows:list[tuple] = self.read_cxn.execute(
+                    f'SELECT table_number FROM ReservationAtTable '
+                    f'WHERE table_number IN ({placeholders}) '
+                    f'AND reservation_datetime = ?',
+                    (*table_numbers, datetime)
+                ).fetchall()
+            else:
+                # Same exclusive-bounds range predicate as check_table_available()
+                lower, upper = self._spacing_bounds(datetime, spacing)
+                rows:list[tuple] = self.read_cxn.execute(
+                    f'SELECT table_number FROM ReservationAtTable '
+                    f'WHERE table_number IN ({placeholders}) '
+                    f'AND reservation_datetime > ? '
+                    f'AND reservation_datetime < ?',
+                    (*table_numbers, lower, upper)
+                ).fetchall()
+
+            # Available tables = requested minus conflicting
+            return set(table_numbers) - {r[0] for r in rows}
+
+        # Handle exceptions as "nothing available"
+        except Exception as e:
+            self.log_error('check_tables_available()', e)
+            return set()
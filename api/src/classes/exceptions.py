@@ -1,5 +1,9 @@
 
-class InvalidTableNumberError(Exception): 
+class InvalidTableNumberError(Exception):
+
+    # NOTE: slotted so constructing these in tight validation loops skips the per-instance dict
+    __slots__ = ('message',)
+
     def __init__(self, table_numbers:list[int]|None=None):
         
         # Base message string
@@ -16,6 +20,9 @@ class InvalidTableNumberError(Exception):
 
 
 class ReservationNotFound(Exception):
+
+    __slots__ = ('message',)
+
     def __init__(self, info:dict|None=None):
 
         # Base msg string
@@ -33,7 +40,10 @@ class ReservationNotFound(Exception):
 
 
 class OverlappingReservationsError(Exception):
-    def __init__(self, time:str, table_number:int, spacing:int): 
+
+    __slots__ = ('message',)
+
+    def __init__(self, time:str, table_number:int, spacing:int):
         msg:str = f'There is already a reservation at table "{table_number}" within {spacing} hours of "{time}".'
         super().__init__(msg)
         self.message = msg
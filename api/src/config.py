@@ -0,0 +1,59 @@
+
+# Standard imports
+import os
+from configparser import ConfigParser
+from dataclasses import dataclass
+
+
+# Fix rel path setup
+SRC_DIR:str = os.path.dirname(os.path.abspath(__file__))    # Absolute path to src/
+BASE_DIR:str = os.path.dirname(SRC_DIR)                     # Absolute path to api/
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Immutable application config, read from config.conf exactly once per process.
+
+    NOTE: frozen + slots so attribute access is a C-level slot lookup and the values cannot drift
+    between workers/blueprints.
+    """
+
+    # Paths
+    logs_dir:str            # Path to the directory containing log files
+    data_dir:str            # Path to the directory containing all the data and database file
+    flask_log_file:str      # Path to the output log file for the flask app
+    db_file:str             # Path to the database file
+
+    # Logging
+    flask_logger_name:str
+
+    # API
+    cors_origin:str
+    backend_port:int
+    reset_logs:bool
+
+
+def _load_config() -> Config:
+    """Builds the Config instance from config.conf; called once at import time."""
+
+    # Init and read config
+    parser:ConfigParser = ConfigParser()
+    parser.read(os.path.join(BASE_DIR, 'config.conf'))
+
+    # Build paths from bases in config
+    logs_dir:str = os.path.join(BASE_DIR, parser['paths']['LOGS_DIR'])
+
+    return Config(
+        logs_dir=logs_dir,
+        data_dir=os.path.join(BASE_DIR, parser['paths']['DATA_DIR']),
+        flask_log_file=os.path.join(logs_dir, 'flask.log'),
+        db_file=parser['paths']['DATABASE_FILEPATH'],
+        flask_logger_name=parser['logging']['FLASK_LOGGER_NAME'],
+        cors_origin=parser['api']['CORS_ORIGIN'],
+        backend_port=parser.getint('api', 'BACKEND_PORT'),
+        reset_logs=parser.getboolean('api', 'RESET_LOGS')
+    )
+
+
+# Single shared instance
+CONFIG:Config = _load_config()
@@ -1,7 +1,11 @@
 from flask import Flask, request, abort
 from flask_compress import Compress
 from flask_cors import CORS
-import logging 
+import logging
+
+
+# Addresses allowed to reach the API (localhost only)
+_LOCAL_ADDRS:frozenset[str] = frozenset({'127.0.0.1', '::1'})
 
 
 def create_app(logger:logging.Logger, cors_origin:str|list[str], allow_headers:list[str]=['Content-Type'], register_test_endpoint:bool=True) -> Flask: 
@@ -36,9 +40,11 @@ def create_app(logger:logging.Logger, cors_origin:str|list[str], allow_headers:l
 
 def register_request_hooks(app:Flask, logger:logging.Logger, cors_origin:str|list[str]):
 
-    # Define the headers for the response that are the same no matter what the response is 
+    # Define the headers for the response that are the same no matter what the response is
+    # NOTE: built once at registration; a list of origins is joined so the header value is never a
+    # stringified Python list
     response_headers:dict[str, str] = {
-        'Access-Control-Allow-Origin': cors_origin,
+        'Access-Control-Allow-Origin': ', '.join(cors_origin) if isinstance(cors_origin, list) else cors_origin,
         'Access-Control-Allow-Credentials': 'true',
         'Access-Control-Allow-Headers': 'Content-Type'
     }
@@ -48,24 +54,30 @@ def register_request_hooks(app:Flask, logger:logging.Logger, cors_origin:str|lis
     def before_request():
 
         # Log incomming request
-        try: 
-            logger.info(f"INCOMING request: METHOD = {request.method}, PATH = {request.path}")
-            logger.debug(f'Headers: {dict(request.headers)}')
+        try:
+            # NOTE: %-style args are only interpolated if the record is actually emitted
+            logger.info("INCOMING request: METHOD = %s, PATH = %s", request.method, request.path)
+
+            # NOTE: only materialize the headers dict when DEBUG is actually emitted
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Headers: %s', dict(request.headers))
 
             # Restrict to localhost connections
-            if request.remote_addr not in ("127.0.0.1", "::1"):
-                logger.warning(f"Rejected request from {request.remote_addr}")
+            if request.remote_addr not in _LOCAL_ADDRS:
+                logger.warning("Rejected request from %s", request.remote_addr)
                 abort(403, description="Access denied: only localhost connections are allowed.")
 
             # Log body or params based on req type
-            match(request.method): 
-                case 'POST': 
-                    logger.debug(f'Request body: {request.get_json()}')
-                case 'GET': 
-                    logger.debug(f'Request args: {request.args}')
-                case _: 
-                    pass
-        except Exception as e: 
+            # NOTE: get_json() parses the whole body, so skip it entirely unless DEBUG is on
+            if logger.isEnabledFor(logging.DEBUG):
+                match(request.method):
+                    case 'POST':
+                        logger.debug('Request body: %s', request.get_json(silent=True))
+                    case 'GET':
+                        logger.debug('Request args: %s', request.args)
+                    case _:
+                        pass
+        except Exception as e:
             logger.error('Error from incoming connection.', exc_info=e)
 
 
@@ -73,9 +85,12 @@ def register_request_hooks(app:Flask, logger:logging.Logger, cors_origin:str|lis
     @app.after_request
     def after_request(response):
 
-        # Add response headers 
-        for k,v in response_headers.items(): response.headers[k] = v
-        
-        # Log and return 
-        logger.info(f'OUTGOING response: {request.remote_addr} {request.method} {request.path} | HEADERS: {dict(response.headers)}')
-        return response 
+        # Add response headers in one call instead of a per-key __setitem__ loop
+        response.headers.update(response_headers)
+
+        # Log and return
+        # NOTE: only materialize the headers dict when DEBUG is actually emitted
+        logger.info('OUTGOING response: %s %s %s', request.remote_addr, request.method, request.path)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Response headers: %s', dict(response.headers))
+        return response
@@ -11,8 +11,8 @@ PRAGMA foreign_keys = ON;
  */
 CREATE TABLE Customer(
     customer_id INTEGER PRIMARY KEY,
-    first_name TEXT NOT NULL,
-    last_name TEXT NOT NULL,
+    first_name TEXT NOT NULL COLLATE NOCASE,    -- NOCASE so lookups/upserts match names case-insensitively
+    last_name TEXT NOT NULL COLLATE NOCASE,
     phone_number TEXT NOT NULL,
     email TEXT DEFAULT NULL,
     
@@ -57,7 +57,11 @@ CREATE TABLE Reservation(
 );
 
 
-/** Table(table_number, default_chairs, max_chairs, **) 
+-- Index for date-range lookups on reservations (e.g. "all reservations on a given day")
+CREATE INDEX idx_reservation_dt ON Reservation(reservation_datetime);
+
+
+/** Table(table_number, default_chairs, max_chairs, **)
  * - Each table has a unique table_number 
  * - Each table is assigned a default number of chairs, which is the number of chairs automatically set for that table
  * - Each table is assigned a max number of chairs, which is the maximum number of chairs that will fit at that table 
@@ -18,6 +18,12 @@ CREATE TABLE ReservationAtTable(
     FOREIGN KEY (table_number) REFERENCES _Table(table_number)
 );
 
+-- Index for availability checks, which filter by (table_number, reservation_datetime)
+-- NOTE:
+-- - The PK is ordered (reservation_id, ...) so it cannot serve these lookups
+-- - reservation_id is included so the hot probes are answered from the index alone (covering)
+CREATE INDEX idx_rat_table_dt ON ReservationAtTable(table_number, reservation_datetime, reservation_id);
+
 
 
 /** SectionInLayout(section_id, layout_id, section_number, server_name)
@@ -1,14 +1,36 @@
-import logging 
-import os 
+import atexit
+import datetime as dt
+import logging
+import logging.handlers
+import os
+import queue
+import re
 
+# NOTE: imported at module scope -- the lazy in-function imports still paid a sys.modules lookup
+# and attribute fetch on every call of the hot standardization helpers
+import pandas as pd
 
-def standardize_phone_number(phone_number:str|int) -> str: 
-    """Takes in a phone number (as str or an int) and returns the number in (000) 000-0000 format; raises 
+
+# Translation table that deletes every non-digit (ASCII) character
+# NOTE: built once at import time; str.translate with a precomputed table is several times faster
+# than re.sub(r'\D', ...) per call on this hot path
+_NON_DIGIT_TABLE:dict[int,None] = str.maketrans('', '', ''.join(chr(c) for c in range(256) if not chr(c).isdigit()))
+
+# Canonical 'YYYY-MM-DD HH:MM:SS' shape -- the format the db CHECK constraints enforce, and
+# therefore the dominant input to standardize_date()
+_ISO_RE:re.Pattern = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+
+# Log directories already created by setup_logger() -- checked before calling makedirs so apps
+# that set up many sub-loggers don't pay a redundant stat syscall per call
+_ensured_dirs:set[str] = set()
+
+
+def standardize_phone_number(phone_number:str|int) -> str:
+    """Takes in a phone number (as str or an int) and returns the number in (000) 000-0000 format; raises
     ValueError if the given phone number is invalid."""
-    import re 
 
     # Convert to string and strip non-digits
-    digits:str = re.sub(r"\D", "", str(phone_number))
+    digits:str = str(phone_number).translate(_NON_DIGIT_TABLE)
     
     # Handle 10-digit numbers
     if len(digits) == 10:
@@ -22,44 +44,130 @@ def standardize_phone_number(phone_number:str|int) -> str:
     raise ValueError(f"Invalid phone number: {phone_number}")
 
 
-def standardize_date(date_str:str) -> str: 
+def standardize_phone_numbers(phone_numbers:pd.Series) -> pd.Series:
+    """Vectorized standardize_phone_number() for a whole pandas Series: returns the numbers in
+    (000) 000-0000 format, or raises ValueError if any value is invalid.
+
+    NOTE: one C-level pass per operation over the column instead of a Python call per row -- use
+    this for bulk ingest, and the scalar version for single values.
+    """
+
+    # Strip non-digits across the whole column at once
+    digits:pd.Series = phone_numbers.astype(str).str.replace(r'\D', '', regex=True)
+
+    # 11-digit numbers starting with "1" (common US country code) drop the leading digit
+    is_11:pd.Series = digits.str.len().eq(11) & digits.str.startswith('1')
+    digits = digits.where(~is_11, digits.str[1:])
+
+    # Everything must be exactly 10 digits now
+    invalid:pd.Series = ~digits.str.len().eq(10)
+    if invalid.any():
+        raise ValueError(f'Invalid phone number(s): {phone_numbers[invalid].tolist()}')
+
+    # Format the whole column in one vectorized concatenation
+    return '(' + digits.str[0:3] + ') ' + digits.str[3:6] + '-' + digits.str[6:10]
+
+
+def standardize_date(date_str:str) -> str:
     """Converts the given date string to 'YYYY-MM-DD HH:MM:SS', or raises a ValueError if the given
     string is not a valid date string."""
-    from pandas import to_datetime
+    date_str = str(date_str)
+
+    # Short-circuit: already in canonical form (the dominant case, since that is what the db
+    # stores) -- one C-level regex compare instead of a parse + re-format round trip
+    if _ISO_RE.fullmatch(date_str): return date_str
 
-    try: 
-        return to_datetime(date_str, errors='raise').strftime('%Y-%m-%d %H:%M:%S')
+    # Fast path: the string is already (close to) ISO format, which is what the db stores and the
+    # frontend sends -- fromisoformat is a C-level parse with no dispatch overhead
+    try:
+        return dt.datetime.fromisoformat(date_str).strftime('%Y-%m-%d %H:%M:%S')
+    except (ValueError, TypeError):
+        pass
+
+    # Slow path: hand anything else to dateutil's full parser
+    # NOTE: imported lazily since most callers never reach this branch (dateutil ships with pandas)
+    from dateutil.parser import parse
+    try:
+        return parse(date_str).strftime('%Y-%m-%d %H:%M:%S')
     except Exception:
         raise ValueError(f'Invalid date string: {date_str}')
     
 
-def setup_logger(log_file_path:str, logger_name:str, min_level:int=logging.DEBUG, log_format:str='%(asctime)s - %(levelname)s: %(message)s') -> logging.Logger:
-    """Sets up a logger to save logs to the given filepath."""
-    
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler variant that writes through a large (64 KiB) buffer instead of forcing a write
+    syscall per record.
+
+    NOTE: StreamHandler.emit() flushes after every record; here flush() is a no-op, so records
+    coalesce in the buffer and hit the disk when it fills or the handler is closed (closing the
+    stream flushes the remainder -- the queue listener's stop() does this at shutdown).
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding, errors=self.errors, buffering=65536)
+
+    def flush(self) -> None:
+        pass
+
+
+def _stop_listener(listener:logging.handlers.QueueListener) -> None:
+    """Stops the given queue listener if it is still running; registered with atexit so queued log
+    records are flushed at shutdown (no-op if a caller already stopped it)."""
+    if listener._thread is not None:
+        listener.stop()
+
+
+def setup_logger(log_file_path:str, logger_name:str, min_level:int=logging.DEBUG, log_format:str='%(asctime)s - %(levelname)s: %(message)s', use_queue:bool=True) -> logging.Logger:
+    """Sets up a logger to save logs to the given filepath.
+
+    NOTE: by default the file handler is fed through a QueueHandler/QueueListener pair, so callers
+    only pay a queue put and the blocking disk write happens on a background thread; pass
+    use_queue=False to write synchronously instead (e.g. in tests).
+    """
+
     # Init a logger and set the lowest level to DEBUG (so all logs are captured)
     logger:logging.Logger = logging.getLogger(logger_name)
     logger.setLevel(min_level)
-    
+
     # Prevent double logging if root logger is used
-    logger.propagate = False  
+    logger.propagate = False
 
     # Avoid duplicate handlers if setup is called multiple times
     if not logger.handlers:
-        
+
         # Create the output dir if it doesn't exist
         # NOTE: default path if log file path is None or empty string
-        if log_file_path == None or not log_file_path: 
+        if log_file_path == None or not log_file_path:
             log_file_path = './logger_output.log'
 
-        os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
+        # NOTE: 'or .' handles bare filenames (dirname() returns '' for them, which makedirs
+        # rejects); the _ensured_dirs check skips the syscall when the dir was already created
+        log_dir:str = os.path.dirname(log_file_path) or '.'
+        if log_dir not in _ensured_dirs:
+            os.makedirs(log_dir, exist_ok=True)
+            _ensured_dirs.add(log_dir)
 
-        # Create a file handler
-        file_handler:logging.FileHandler = logging.FileHandler(log_file_path, encoding='utf-8')
-        logger.addHandler(file_handler)
-        
-        # Set the format for logs 
+        # Create a (buffered) file handler
+        file_handler:logging.FileHandler = BufferedFileHandler(log_file_path, encoding='utf-8')
+
+        # Set the format for logs
         formatter:logging.Formatter = logging.Formatter(log_format)
         file_handler.setFormatter(formatter)
-        
+
+        if use_queue:
+
+            # Attach only a QueueHandler to the logger; the listener thread owns the file handler
+            log_queue:queue.SimpleQueue = queue.SimpleQueue()
+            listener:logging.handlers.QueueListener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+            # Stash the listener on the logger so callers can stop/flush it early if they want,
+            # and stop it at interpreter exit regardless so queued records are flushed to disk
+            logger.queue_listener = listener
+            atexit.register(_stop_listener, listener)
+
+        else:
+            logger.addHandler(file_handler)
+
     # Return the logger
     return logger
\ No newline at end of file
@@ -3,6 +3,21 @@ import sqlite3 as sql
 import pytest
 from datetime import datetime, timedelta
 
+# Probe SQL as module constants (same strings as ResDBConnector._SQL_EXACT/_SQL_RANGE) so every
+# execute() passes the identical string object and hits the statement cache
+_SQL_EXACT = (
+    "SELECT 1 FROM ReservationAtTable "
+    "WHERE table_number = ? AND reservation_datetime = ? "
+    "LIMIT 1"
+)
+
+_SQL_RANGE = (
+    "SELECT 1 FROM ReservationAtTable "
+    "WHERE table_number = ? AND reservation_datetime > ? AND reservation_datetime < ? "
+    "LIMIT 1"
+)
+
+
 # --- Minimal shim so we don't depend on your base DatabaseConnector in tests ---
 class HelperResDBConnector:
     """
@@ -24,48 +39,58 @@ class HelperResDBConnector:
     def log_error(self, *args, **kwargs):
         pass  # silence logs in tests
     
+    @staticmethod
+    def _spacing_bounds(when: str, spacing: float) -> tuple:
+        """Same as ResDBConnector._spacing_bounds: the (lower, upper) ISO strings exactly
+        'spacing' hours before/after the given datetime."""
+        t = datetime.strptime(when, "%Y-%m-%d %H:%M:%S")
+        window = timedelta(hours=spacing)
+        return (
+            (t - window).strftime("%Y-%m-%d %H:%M:%S"),
+            (t + window).strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
     # NOTE: same implementation as ResDBConnector class
-    def check_table_available(self, table_number: int, datetime: str, spacing: float) -> bool:
-        
+    def check_table_available(self, table_number: int, datetime_str: str, spacing: float) -> bool:
+
+        # Connection.execute() shortcut: no per-call Cursor allocation/close
         self._ensure_cxn()
-        cursor: sql.Cursor = self.cxn.cursor()
         try:
             if spacing <= 0:
-                cursor.execute(
-                    """
-                        SELECT 1
-                        FROM ReservationAtTable
-                        WHERE table_number = ?
-                        AND reservation_datetime = ?
-                        LIMIT 1
-                    """,
-                    (table_number, datetime),
-                )
+                row = self.cxn.execute(_SQL_EXACT, (table_number, datetime_str)).fetchone()
             else:
-                cursor.execute(
-                    """
-                        SELECT 1
-                        FROM ReservationAtTable
-                        WHERE table_number = ?
-                        AND ABS(julianday(reservation_datetime) - julianday(?)) * 24 < ?
-                        LIMIT 1
-                    """,
-                    (table_number, datetime, float(spacing)),
-                )
-            return cursor.fetchone() is None
+                # Range predicate on the raw ISO strings (they sort chronologically) so the query
+                # can use an index on (table_number, reservation_datetime); julianday() wrapping
+                # made the predicate unindexable. Bounds are exclusive to preserve the strict
+                # "< spacing" boundary semantics.
+                lower, upper = self._spacing_bounds(datetime_str, spacing)
+                row = self.cxn.execute(_SQL_RANGE, (table_number, lower, upper)).fetchone()
+            return row is None
         except Exception as e:
             self.log_error("check_table_available()", e)
             return False
-        finally:
-            cursor.close()
 
 
 # ---------- Fixtures: database & test helper inserts ----------
 
+def _tune(conn: sql.Connection):
+    """Applies the same per-connection pragmas as the production connector.
+
+    NOTE: journal_mode=WAL is omitted -- ':memory:' databases ignore it -- but the rest keeps the
+    fixture's behavior (locking, sync, caching) aligned with what production connections run with.
+    """
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA cache_size = -20000;")
+    conn.execute("PRAGMA busy_timeout = 5000;")
+    conn.execute("PRAGMA foreign_keys = ON;")
+
+
 @pytest.fixture
 def cxn():
-    conn = sql.connect(":memory:")
-    conn.execute("PRAGMA foreign_keys = ON;")
+    # NOTE: cached_statements raised to match the production connector
+    conn = sql.connect(":memory:", cached_statements=256)
+    _tune(conn)
 
     # Minimal schemas to satisfy FKs
     # NOTE: 
@@ -127,11 +152,16 @@ def cxn():
                 REFERENCES Reservation(reservation_id, reservation_datetime),
             FOREIGN KEY (table_number) REFERENCES _Table(table_number)
         );
+
+        -- Same covering index as the production DDL: the PK leads with reservation_id, so the
+        -- availability probes on (table_number, reservation_datetime) need this to seek
+        CREATE INDEX idx_rat_table_dt ON ReservationAtTable(table_number, reservation_datetime, reservation_id);
         """
     )
 
-    # Seed a couple of tables as inventory
-    conn.executemany("INSERT INTO _Table(table_number) VALUES (?)", [(1,), (2,), (3,)])
+    # Seed a couple of tables as inventory (one commit for the whole seed)
+    with conn:
+        conn.executemany("INSERT INTO _Table(table_number) VALUES (?)", [(1,), (2,), (3,)])
 
     yield conn
     conn.close()
@@ -143,24 +173,28 @@ def svc(cxn):
 
 
 def _mk_res(cxn, res_id: int, table_number: int, when_str: str, customer_id: int = 1):
-    """Helper: insert a Reservation row + link it to a table in ReservationAtTable (satisfying FKs)."""
-    # Ensure a customer exists
-    cxn.execute(
-        "INSERT OR IGNORE INTO Customer(customer_id, first_name, last_name, phone_number, email) "
-        "VALUES (?, 'A','B','000','')",
-        (customer_id,),
-    )
-    # Insert reservation (note: composite PK requires both columns)
-    cxn.execute(
-        "INSERT INTO Reservation(reservation_id, customer_id, reservation_datetime) VALUES (?, ?, ?)",
-        (res_id, customer_id, when_str),
-    )
-    # Attach to table
-    cxn.execute(
-        "INSERT INTO ReservationAtTable(reservation_id, reservation_datetime, table_number) VALUES (?, ?, ?)",
-        (res_id, when_str, table_number),
-    )
-    cxn.commit()
+    """Helper: insert a Reservation row + link it to a table in ReservationAtTable (satisfying FKs).
+
+    NOTE: the connection context manager commits the three inserts as one transaction instead of
+    a commit per statement.
+    """
+    with cxn:
+        # Ensure a customer exists
+        cxn.execute(
+            "INSERT OR IGNORE INTO Customer(customer_id, first_name, last_name, phone_number, email) "
+            "VALUES (?, 'A','B','000','')",
+            (customer_id,),
+        )
+        # Insert reservation (note: composite PK requires both columns)
+        cxn.execute(
+            "INSERT INTO Reservation(reservation_id, customer_id, reservation_datetime) VALUES (?, ?, ?)",
+            (res_id, customer_id, when_str),
+        )
+        # Attach to table
+        cxn.execute(
+            "INSERT INTO ReservationAtTable(reservation_id, reservation_datetime, table_number) VALUES (?, ?, ?)",
+            (res_id, when_str, table_number),
+        )
 
 
 # ---------- Tests ----------
@@ -218,6 +252,21 @@ def test_same_time_different_table_is_available(svc, cxn):
     assert svc.check_table_available(1, target, spacing=2.0) is True
 
 
+def test_availability_probe_uses_covering_index(svc, cxn):
+    # The hot probe must be answered by an index seek, not a table scan
+    lower, upper = svc._spacing_bounds("2025-09-14 18:00:00", 2.0)
+    plan = cxn.execute(
+        "EXPLAIN QUERY PLAN "
+        "SELECT 1 FROM ReservationAtTable "
+        "WHERE table_number = ? AND reservation_datetime > ? AND reservation_datetime < ? "
+        "LIMIT 1",
+        (1, lower, upper),
+    ).fetchall()
+    detail = " ".join(row[-1] for row in plan)
+    assert "idx_rat_table_dt" in detail, f"Expected the covering index in the plan, got: {detail}"
+    assert "SCAN" not in detail, f"Expected an index seek, got a scan: {detail}"
+
+
 def test_handles_missing_table_gracefully_when_querying(svc, cxn):
     # There is no row in _Table for table 999, but check_table_available only reads ReservationAtTable,
     # so it should still return True (no conflicts).
@@ -6,10 +6,26 @@ from classes.ResDBConnector import ResDBConnector
 from classes.exceptions import *
 from utils import *
 
+@pytest.fixture(scope="module")
+def _shared_connector():
+    """One in-memory connector shared by the whole module.
+
+    Constructing a ResDBConnector re-opens a sqlite connection, re-runs the base DatabaseConnector
+    init, and re-applies the PRAGMAs -- that setup cost dominates these short tests, so it is paid
+    once. Per-test state lives in the function-scoped `connector` fixture below.
+    """
+    # NOTE: log_file_path=None skips the file handler entirely (no log I/O in the hot test path)
+    return ResDBConnector(":memory:", log_file_path=None)
+
+
 @pytest.fixture
-def connector(monkeypatch):
-    """In-memory connector with logging stubbed out; DB calls will be monkeypatched per-test."""
-    c = ResDBConnector(":memory:")
+def connector(_shared_connector, monkeypatch):
+    """The shared connector with logging stubbed out; DB calls will be monkeypatched per-test.
+
+    NOTE: monkeypatch is function-scoped, so every stub (including _logged) is undone after each
+    test -- tests see the shared connector but never each other's patches.
+    """
+    c = _shared_connector
 
     # Silence logs but keep call recording if needed
     logged = {"errors": [], "warnings": [], "debug": []}
@@ -26,10 +42,29 @@ def connector(monkeypatch):
     monkeypatch.setattr(c, "log_error", log_error, raising=False)
     monkeypatch.setattr(c, "log_warning", log_warning, raising=False)
     monkeypatch.setattr(c, "log_debug", log_debug, raising=False)
-    c._logged = logged
+    monkeypatch.setattr(c, "_logged", logged, raising=False)
     return c
 
 
+class _FakeCxn:
+    """Minimal sqlite3.Connection stand-in that records executemany calls (and can raise on demand)."""
+
+    def __init__(self, raise_exc=None):
+        self.calls = []
+        self._raise_exc = raise_exc
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def executemany(self, sql_text, rows):
+        if self._raise_exc is not None:
+            raise self._raise_exc
+        self.calls.append((sql_text.strip(), list(rows)))
+
+
 def _stub_reservation_info(monkeypatch, connector, res_id=1, when="2025-09-14 18:30:00"):
     monkeypatch.setattr(
         connector,
@@ -70,13 +105,13 @@ def test_raises_on_overlapping_single_table(connector, monkeypatch):
     monkeypatch.setattr(connector, "check_table_numbers", lambda tns: True, raising=False)
 
     # mark table as unavailable (overlap)
-    def check_table_available(tn, dt, spacing):
-        assert tn == 5
+    def check_tables_available(tns, dt, spacing):
+        assert tns == [5]
         assert dt == when
         assert spacing == 2
-        return False
+        return set()  # nothing available
 
-    monkeypatch.setattr(connector, "check_table_available", check_table_available, raising=False)
+    monkeypatch.setattr(connector, "check_tables_available", check_tables_available, raising=False)
 
     with pytest.raises(OverlappingReservationsError):
         connector.update_reservation_tables(1, [5])
@@ -87,11 +122,11 @@ def test_raises_on_overlapping_among_multiple_tables(connector, monkeypatch):
     monkeypatch.setattr(connector, "check_table_numbers", lambda tns: True, raising=False)
 
     # First table free, second overlaps -> should raise
-    def check_table_available(tn, dt, spacing):
+    def check_tables_available(tns, dt, spacing):
         assert dt == when
-        return tn == 10  # 10 is free, 12 will be treated as overlap (False)
+        return {10}  # 10 is free, 12 will be treated as overlap
 
-    monkeypatch.setattr(connector, "check_table_available", check_table_available, raising=False)
+    monkeypatch.setattr(connector, "check_tables_available", check_tables_available, raising=False)
 
     with pytest.raises(OverlappingReservationsError):
         connector.update_reservation_tables(1, [10, 12])
@@ -100,27 +135,22 @@ def test_raises_on_overlapping_among_multiple_tables(connector, monkeypatch):
 def test_success_inserts_single_and_multiple(connector, monkeypatch):
     when = _stub_reservation_info(monkeypatch, connector, res_id=42)
     monkeypatch.setattr(connector, "check_table_numbers", lambda tns: True, raising=False)
-    monkeypatch.setattr(connector, "check_table_available", lambda tn, dt, sp: True, raising=False)
+    monkeypatch.setattr(connector, "check_tables_available", lambda tns, dt, sp: set(tns), raising=False)
 
-    captured_calls = []
-
-    def execute_many(sql_text, params_list, raise_on_error=True):
-        captured_calls.append((sql_text.strip(), list(params_list), raise_on_error))
-
-    monkeypatch.setattr(connector, "execute_many", execute_many, raising=False)
+    fake_cxn = _FakeCxn()
+    monkeypatch.setattr(connector, "cxn", fake_cxn, raising=False)
 
     # single table
     connector.update_reservation_tables(42, [3])
-    assert captured_calls, "Expected INSERT to be executed"
-    sql_text, params, flag = captured_calls[-1]
+    assert fake_cxn.calls, "Expected INSERT to be executed"
+    sql_text, params = fake_cxn.calls[-1]
     assert "INSERT INTO ReservationAtTable" in sql_text
-    assert params == [[42, when, 3]]
-    assert flag is True
+    assert params == [(42, when, 3)]
 
     # multiple tables
     connector.update_reservation_tables(42, [1, 2, 3])
-    _, params_multi, _ = captured_calls[-1]
-    assert params_multi == [[42, when, 1], [42, when, 2], [42, when, 3]]
+    _, params_multi = fake_cxn.calls[-1]
+    assert params_multi == [(42, when, 1), (42, when, 2), (42, when, 3)]
 
 
 def test_spacing_zero_is_passed_through(connector, monkeypatch):
@@ -129,33 +159,27 @@ def test_spacing_zero_is_passed_through(connector, monkeypatch):
 
     seen = {"calls": []}
 
-    def check_table_available(tn, dt, spacing):
+    def check_tables_available(tns, dt, spacing):
         # The function under test should pass 0 through unchanged.
-        seen["calls"].append((tn, dt, spacing))
-        return True
+        seen["calls"].append((tns, dt, spacing))
+        return set(tns)
 
-    def execute_many(sql_text, params_list, raise_on_error=True):
-        return None
-
-    monkeypatch.setattr(connector, "check_table_available", check_table_available, raising=False)
-    monkeypatch.setattr(connector, "execute_many", execute_many, raising=False)
+    monkeypatch.setattr(connector, "check_tables_available", check_tables_available, raising=False)
+    monkeypatch.setattr(connector, "cxn", _FakeCxn(), raising=False)
 
     connector.update_reservation_tables(1, [7], spacing=0)
-    assert seen["calls"] == [(7, when, 0)], "Expected spacing=0 to be forwarded unchanged"
+    assert seen["calls"] == [([7], when, 0)], "Expected spacing=0 to be forwarded unchanged"
 
 
-def test_execute_many_errors_are_reraised(connector, monkeypatch):
+def test_insert_errors_are_reraised(connector, monkeypatch):
     _stub_reservation_info(monkeypatch, connector, res_id=1)
     monkeypatch.setattr(connector, "check_table_numbers", lambda tns: True, raising=False)
-    monkeypatch.setattr(connector, "check_table_available", lambda tn, dt, sp: True, raising=False)
+    monkeypatch.setattr(connector, "check_tables_available", lambda tns, dt, sp: set(tns), raising=False)
 
     class Boom(Exception):
         pass
 
-    def execute_many(*args, **kwargs):
-        raise Boom("insert failed")
-
-    monkeypatch.setattr(connector, "execute_many", execute_many, raising=False)
+    monkeypatch.setattr(connector, "cxn", _FakeCxn(raise_exc=Boom("insert failed")), raising=False)
 
     with pytest.raises(Boom):
         connector.update_reservation_tables(1, [1, 2])